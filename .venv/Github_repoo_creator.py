@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GitHub 远程仓库自动创建工具
+支持通过 GitHub CLI 或 Personal Access Token 创建仓库
+"""
+
+import os
+import sys
+import subprocess
+import json
+import re
+import shutil
+import threading
+from pathlib import Path
+
+# 处理打包后的路径问题
+if getattr(sys, 'frozen', False):
+    # 如果是打包后的程序
+    application_path = os.path.dirname(sys.executable)
+else:
+    # 如果是脚本运行
+    application_path = os.path.dirname(os.path.abspath(__file__))
+
+# 横幅分隔线, 只计算一次
+_SEP = "=" * 50
+_DASH = "-" * 50
+
+# GitHub 仓库名规则 ('.' 和 '..' 也不允许), 在本地提前校验, 避免一次注定失败的 API 请求
+_REPO_RE = re.compile(r'(?!\.{1,2}\Z)[A-Za-z0-9._-]{1,100}')
+
+# gh 未登录时 stderr 中会出现的关键字
+_GH_AUTH_ERRORS = ('not logged', 'authentication', 'gh auth login')
+
+# 优先使用更快的 orjson 解析响应, 未安装时使用标准库 json
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# 复用同一个 Session, 多次 API 调用共享 keep-alive 连接, 避免重复 TLS 握手
+# requests 导入较慢, 首次调用 API 时才创建
+_SESSION = None
+
+
+def _get_session():
+    """获取共享的 requests.Session"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _SESSION = requests.Session()
+        _SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=2))
+        _SESSION.headers.update({'Accept': 'application/vnd.github.v3+json'})
+    return _SESSION
+
+
+def _warm_up_connection():
+    """提前与 api.github.com 建立 TCP/TLS 连接, 放入连接池供之后的请求复用"""
+    import requests
+
+    try:
+        # 只为建立连接, 不带上 Token
+        _get_session().head('https://api.github.com/',
+                            headers={'Authorization': None},
+                            timeout=(5, 5))
+    except requests.RequestException:
+        # 预热失败不影响后续请求, 它们会自行建立连接
+        pass
+
+
+def _copy_to_clipboard(text, outcome):
+    """在后台线程中复制到剪贴板, 成功时向 outcome 追加 None, 失败时追加异常"""
+    try:
+        # pyperclip 只在这里用到, 延迟导入
+        import pyperclip
+        pyperclip.copy(text)
+        outcome.append(None)
+    except Exception as e:
+        outcome.append(e)
+
+
+class GitHubRepoCreator:
+    def __init__(self):
+        self.use_gh_cli = False
+        self.gh_authed = False
+        self.token = None
+        self.username = None
+
+    def gh_login(self):
+        """启动 GitHub CLI 登录流程"""
+        print("\n[提示] 正在启动 GitHub CLI 登录流程...")
+        try:
+            subprocess.run(['gh', 'auth', 'login'], check=True)
+            return True
+        except subprocess.CalledProcessError:
+            return False
+
+    def get_token_from_input(self):
+        """从用户输入获取 PAT"""
+        sys.stdout.write(
+            f"\n{_SEP}\n"
+            "GitHub Personal Access Token (PAT) 配置\n"
+            f"{_SEP}\n"
+            "\n如何获取 PAT:\n"
+            "1. 访问: https://github.com/settings/tokens\n"
+            "2. 点击 'Generate new token' → 'Tokens (classic)'\n"
+            "3. 勾选 'repo' 权限\n"
+            "4. 生成并复制 Token\n\n"
+        )
+
+        token = input("请输入你的 GitHub PAT (或按 Enter 跳过): ").strip()
+        return token if token else None
+
+    def start_gh_user_query(self):
+        """启动 gh api user 进程但不等待结果"""
+        return subprocess.Popen(['gh', 'api', 'user', '--jq', '.login'],
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE,
+                                text=True,
+                                encoding='utf-8',
+                                errors='ignore')
+
+    def get_username_from_gh(self, proc=None):
+        """通过 GitHub CLI 获取用户名, 返回 (用户名, 错误信息), 失败时用户名为 None"""
+        if proc is None:
+            proc = self.start_gh_user_query()
+        try:
+            stdout, stderr = proc.communicate(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            return None, "命令执行超时"
+        if proc.returncode == 0:
+            return stdout.strip(), None
+        return None, stderr.strip()
+
+    def create_repo_with_gh(self, repo_name, description, is_private):
+        """使用 GitHub CLI 创建仓库"""
+        cmd = ['gh', 'repo', 'create', repo_name]
+        cmd.append('--private' if is_private else '--public')
+
+        if description:
+            cmd.extend(['--description', description])
+
+        try:
+            result = subprocess.run(cmd,
+                                    capture_output=True,
+                                    text=True,
+                                    encoding='utf-8',
+                                    errors='ignore',
+                                    timeout=30)
+            return result.returncode == 0, result.stderr
+        except subprocess.TimeoutExpired:
+            return False, "命令执行超时"
+
+    def create_repo_with_api(self, repo_name, description, is_private):
+        """使用 GitHub API 创建仓库 (认证头已在 setup_auth 中设置到 Session)"""
+        import requests
+
+        data = {
+            'name': repo_name,
+            'private': is_private,
+            'auto_init': False
+        }
+
+        if description:
+            data['description'] = description
+
+        try:
+            response = _get_session().post('https://api.github.com/user/repos',
+                                           json=data,
+                                           timeout=(5, 25))
+
+            if response.status_code == 201:
+                # 响应体中已包含 clone_url 等仓库信息
+                return True, _json_loads(response.content)
+            else:
+                try:
+                    error_msg = _json_loads(response.content).get('message', '未知错误')
+                except ValueError:
+                    error_msg = '未知错误'
+                return False, f"创建失败 ({response.status_code}): {error_msg}"
+        except requests.RequestException as e:
+            return False, f"网络请求失败: {e}"
+
+    def setup_auth(self):
+        """设置认证方式"""
+        sys.stdout.write(f"\n{_SEP}\n     GitHub 远程仓库自动创建工具\n{_SEP}\n")
+
+        # 检查 GitHub CLI: 先在 PATH 中查找, 已安装时再用一次 gh api user
+        # 同时完成登录检测和获取用户名
+        self.use_gh_cli = shutil.which('gh') is not None
+        if self.use_gh_cli:
+            # 先启动 gh 进程, 等待它的同时预先导入 requests, 两者重叠进行
+            try:
+                proc = self.start_gh_user_query()
+            except OSError:
+                # PATH 中能找到但无法启动 (如损坏的脚本, Windows 上的 gh.cmd), 按未安装处理
+                self.use_gh_cli = False
+        if self.use_gh_cli:
+            # 只导入模块, Session 仍在使用 PAT 时才创建; 未安装 requests 也不影响 gh
+            try:
+                import requests  # noqa: F401
+            except ImportError:
+                pass
+            self.username, gh_error = self.get_username_from_gh(proc)
+            self.gh_authed = self.username is not None
+
+        if self.use_gh_cli:
+            print("\n[检测] 已安装 GitHub CLI")
+            if self.gh_authed:
+                print("[检测] GitHub CLI 已登录")
+                return True
+            elif not any(key in gh_error.lower() for key in _GH_AUTH_ERRORS):
+                # 不是登录问题 (如网络错误), 重新登录也无济于事, 直接改用 PAT
+                print(f"[错误] GitHub CLI 调用失败: {gh_error}")
+            else:
+                print("[检测] GitHub CLI 未登录")
+                choice = input("\n是否使用 GitHub CLI 登录? (Y/N, 默认 Y): ")
+                if choice[:1] not in ('n', 'N'):
+                    if self.gh_login():
+                        self.username, _ = self.get_username_from_gh()
+                        return True
+                    else:
+                        print("[错误] GitHub CLI 登录失败")
+        else:
+            print("\n[提示] 未检测到 GitHub CLI")
+            print("可以安装 GitHub CLI: https://cli.github.com/")
+
+        # 使用 PAT, 优先读取环境变量 GITHUB_TOKEN
+        self.token = os.environ.get('GITHUB_TOKEN', '').strip() or self.get_token_from_input()
+        if not self.token:
+            print("\n[错误] 未配置任何认证方式")
+            return False
+
+        # 认证头只设置一次, 之后的 API 请求共用
+        _get_session().headers['Authorization'] = f'token {self.token}'
+
+        # 不再单独请求 /user 验证 Token, 创建仓库的请求本身即可验证
+        self.username = None
+        return True
+
+    def get_repo_info(self):
+        """获取仓库信息"""
+        sys.stdout.write(f"\n{_DASH}\n")
+
+        # 仓库名称
+        repo_name = input("请输入仓库名称: ").strip()
+        if not repo_name:
+            print("[错误] 仓库名称不能为空")
+            return None
+        # gh 方式支持 owner/repo 形式 (创建到组织下), 只校验仓库名部分
+        name = repo_name
+        if self.use_gh_cli and not self.token and repo_name.count('/') == 1:
+            owner, name = repo_name.split('/')
+            if not owner:
+                name = repo_name
+        if not _REPO_RE.fullmatch(name):
+            print("[错误] 仓库名不合法 (只能包含字母、数字、'.'、'-'、'_', 最多 100 个字符)")
+            return None
+
+        # 默认描述为 1.0
+        description = "1.0"
+
+        # 默认为公开仓库
+        is_private = False
+
+        return {
+            'name': repo_name,
+            'description': description,
+            'is_private': is_private
+        }
+
+    def create_repository(self):
+        """创建仓库主流程"""
+        if not self.setup_auth():
+            return False
+
+        # 使用 API 时, 在用户输入仓库名称的同时后台建立连接, 创建请求时无需再握手
+        if self.token:
+            threading.Thread(target=_warm_up_connection, daemon=True).start()
+
+        repo_info = self.get_repo_info()
+        if not repo_info:
+            return False
+
+        # 显示信息但不需要确认
+        sys.stdout.write(
+            f"\n{_DASH}\n"
+            f"仓库名称: {repo_info['name']}\n"
+            f"仓库描述: {repo_info['description']}\n"
+            f"可见性: {'私有' if repo_info['is_private'] else '公开'}\n"
+            f"{_DASH}\n"
+        )
+
+        # 创建仓库
+        print("\n[信息] 正在创建仓库...")
+
+        if self.use_gh_cli and not self.token:
+            success, result = self.create_repo_with_gh(
+                repo_info['name'],
+                repo_info['description'],
+                repo_info['is_private']
+            )
+        else:
+            success, result = self.create_repo_with_api(
+                repo_info['name'],
+                repo_info['description'],
+                repo_info['is_private']
+            )
+
+        if not success:
+            print(f"[错误] 仓库创建失败: {result}")
+            return False
+
+        # 构建仓库 URL: API 方式直接使用响应中的地址
+        if isinstance(result, dict):
+            repo_url = result['clone_url']
+        else:
+            full_name = repo_info['name']
+            if '/' not in full_name:
+                full_name = f"{self.username}/{full_name}"
+            repo_url = f"https://github.com/{full_name}.git"
+
+        # 复制到剪贴板可能较慢 (xclip/剪贴板被占用), 放到后台线程, 与输出同时进行
+        outcome = []
+        clipboard_thread = threading.Thread(target=_copy_to_clipboard,
+                                            args=(repo_url, outcome),
+                                            daemon=True)
+        clipboard_thread.start()
+
+        print(f"\n[成功] 仓库创建成功!")
+        print(f"\n仓库地址: {repo_url}")
+
+        clipboard_thread.join(timeout=0.5)
+        if not outcome:
+            print("\n[提示] 正在复制到剪贴板, 如未成功请手动复制上面的地址")
+        elif isinstance(outcome[0], ImportError):
+            print("\n[警告] pyperclip 模块未安装，将无法自动复制到剪贴板")
+            print("[提示] 请手动复制上面的地址")
+        elif outcome[0] is not None:
+            print(f"\n[警告] 复制到剪贴板失败: {outcome[0]}")
+            print("请手动复制上面的地址")
+        else:
+            print("\n[成功] 仓库地址已复制到剪贴板!")
+
+        return True
+
+
+def main():
+    # 设置控制台编码为 UTF-8 (无需导入 ctypes)
+    if sys.platform == 'win32':
+        try:
+            sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+            sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+        except (AttributeError, ValueError):
+            pass
+
+    # 确保即使出错也能看到错误信息
+    try:
+        print("正在启动 GitHub 仓库创建工具...")
+        print("Python 版本:", sys.version)
+        print("工作目录:", os.getcwd())
+        print()
+
+        creator = GitHubRepoCreator()
+        success = creator.create_repository()
+
+        # 无论成功失败都等待用户按键
+        if success:
+            sys.stdout.write(f"\n{_SEP}\n操作完成!\n{_SEP}\n")
+
+    except KeyboardInterrupt:
+        print("\n\n[提示] 用户取消操作")
+    except Exception as e:
+        print(f"\n[错误] 发生未预期的错误: {e}")
+        print(f"错误类型: {type(e).__name__}")
+        import traceback
+        print("\n完整错误信息:")
+        traceback.print_exc()
+    finally:
+        # 确保窗口不会闪退
+        sys.stdout.write(f"\n{_SEP}\n")
+        input("按 Enter 键退出...")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file